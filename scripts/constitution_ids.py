@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -40,15 +42,23 @@ ANCHOR_RE = re.compile(
 
 # ADR filename pattern: NNNN-slug.md
 ADR_FILENAME_RE = re.compile(r"^(?P<num>\d{4})-(?P<slug>.+)\.md$")
+ADR_TITLE_PREFIX_RE = re.compile(r"^ADR-\d+[:\s—-]*", re.IGNORECASE)
+
+# Title and status live in the ADR header; stop reading after this many lines.
+ADR_HEADER_MAX_LINES = 60
 
 # We intentionally ignore code fences to reduce false positives in examples/templates.
 FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
 
-STATUS_RE = re.compile(r"^\*\*Status:\*\*\s*(?P<status>.+?)\s*$", re.IGNORECASE)
-TAGS_RE = re.compile(r"^\*\*Tags:\*\*\s*(?P<tags>.+?)\s*$", re.IGNORECASE)
+# Metadata lines under an anchored heading, matched case-insensitively on the prefix
+STATUS_PREFIX = "**Status:**"
+TAGS_PREFIX = "**Tags:**"
 
 HEADING_RE = re.compile(r"^(?P<level>#{1,6})\s+(?P<text>.+?)\s*$")
 
+# id-catalog.json formatting (dicts keep insertion order, so output is deterministic)
+CATALOG_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
 
 @dataclasses.dataclass(frozen=True)
 class Entry:
@@ -57,6 +67,7 @@ class Entry:
     status: str
     tags: tuple[str, ...]
     file: str  # repo-relative
+    rel_link: str  # link to `file` from a sibling generated index ("./<file name>")
     anchor: str
     href: str  # repo-relative
     section: str  # nearest H2 heading (or "")
@@ -118,20 +129,37 @@ def read_text(path: Path) -> str:
 
 
 def strip_fences(md: str) -> str:
-    return re.sub(FENCE_RE, "", md)
+    # Most docs have no fences; skip the DOTALL scan (and any copy) entirely for those.
+    if "```" not in md:
+        return md
+    return FENCE_RE.sub("", md)
+
 
+@functools.lru_cache(maxsize=None)
+def read_doc(path: Path) -> str:
+    # Canonical docs are scanned for anchors and again for references; read/strip them once.
+    return strip_fences(read_text(path))
 
+
+@functools.lru_cache(maxsize=512)
 def rel(path: Path) -> str:
     return path.relative_to(ROOT).as_posix()
 
 
+def field_value(line: str, prefix: str) -> str:
+    """Return the value after a `**Field:**` prefix (case-insensitive), or "" if absent."""
+    if line[: len(prefix)].lower() != prefix.lower():
+        return ""
+    return line[len(prefix):].strip()
+
+
 def parse_allowed_tags(md: str) -> set[str]:
     # Look for the "## Allowed Tags" section and collect bullets underneath until next H2.
     lines = md.splitlines()
     allowed: set[str] = set()
     in_allowed = False
     for line in lines:
-        m = HEADING_RE.match(line)
+        m = HEADING_RE.match(line) if line.startswith("#") else None
         if m and m.group("level") == "##":
             in_allowed = (m.group("text").strip().lower() == "allowed tags")
             continue
@@ -155,94 +183,119 @@ def parse_entries_from_doc(
     allowed_tags: set[str] | None,
     ec: ErrorCollector,
 ) -> list[Entry]:
-    md = strip_fences(read_text(path))
-    lines = md.splitlines()
+    lines = read_doc(path).splitlines()
+
+    # Per-file path strings, derived once and shared by every entry and error message
+    file_rel = rel(path)
+    rel_link = "./" + path.name
 
     entries: list[Entry] = []
     section = ""
     seen_anchor_lines: dict[str, int] = {}
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        h = HEADING_RE.match(line)
-        if h:
-            level = len(h.group("level"))
-            text = h.group("text")
-
-            # Track H2 as current "section"
-            if level == 2:
-                section = text.strip()
-
-            # Detect anchored ID headings at any level (we recommend H3)
-            a = ANCHOR_RE.search(text)
-            if a:
-                cid = a.group("id")
-
-                # Duplicate anchors within a file
-                if cid in seen_anchor_lines:
-                    ec.add(f"{rel(path)}: duplicate ID anchor found for {cid}")
-                else:
-                    seen_anchor_lines[cid] = i + 1
-
-                # Title is whatever comes after "ID —"
-                cleaned = ANCHOR_RE.sub("", text).strip()
-                cleaned = re.sub(rf"^\s*{re.escape(cid)}\s*", "", cleaned).strip()
-                cleaned = re.sub(r"^[—\-]\s*", "", cleaned).strip()
-                title = cleaned or "<Untitled>"
-
-                # Expect Status and Tags within the next ~12 lines (tolerant)
-                status = ""
-                tags: tuple[str, ...] = tuple()
-                lookahead = 0
-                j = i + 1
-                while j < len(lines) and lookahead < 12:
-                    s_line = lines[j].strip()
-                    if s_line.startswith("#"):
-                        break
-
-                    sm = STATUS_RE.match(s_line)
-                    if sm:
-                        status = sm.group("status").strip()
-
-                    tm = TAGS_RE.match(s_line)
-                    if tm:
-                        raw = tm.group("tags").strip()
-                        if raw.lower() in {"none", "(none)", ""}:
-                            tags = tuple()
-                        else:
-                            parsed = [t.strip() for t in raw.split(",") if t.strip()]
-                            tags = tuple(parsed)
-
-                    j += 1
-                    lookahead += 1
-
-                if not status:
-                    ec.add(f"{rel(path)}: {cid} is missing **Status:**")
-
-                # Tag allowlist checks (batch errors)
-                if allowed_tags is not None:
-                    for t in tags:
-                        if t not in allowed_tags:
-                            ec.add(
-                                f"{rel(path)}: {cid} uses unknown tag '{t}' "
-                                f"(not in tag-taxonomy.md allowlist)"
-                            )
-
-                href = f"{rel(path)}#{cid}"
-                entries.append(
-                    Entry(
-                        id=cid,
-                        title=title,
-                        status=status,
-                        tags=tags,
-                        file=rel(path),
-                        anchor=cid,
-                        href=href,
-                        section=section,
+    # Anchored heading whose Status/Tags are still being collected. We expect them
+    # within the next ~12 lines (tolerant), stopping early at the next heading.
+    pending: Entry | None = None
+    pending_lookahead = 0
+
+    def finalize(e: Entry) -> None:
+        if not e.status:
+            ec.add(f"{file_rel}: {e.id} is missing **Status:**")
+
+        # Tag allowlist checks (batch errors)
+        if allowed_tags is not None:
+            for t in e.tags:
+                if t not in allowed_tags:
+                    ec.add(
+                        f"{file_rel}: {e.id} uses unknown tag '{t}' "
+                        f"(not in tag-taxonomy.md allowlist)"
                     )
-                )
-        i += 1
+
+        entries.append(e)
+
+    for lineno, line in enumerate(lines, start=1):
+        if pending is not None:
+            s_line = line.strip()
+            if pending_lookahead >= 12 or s_line.startswith("#"):
+                finalize(pending)
+                pending = None
+            else:
+                pending_lookahead += 1
+
+                # Both metadata prefixes start with "**"; skip ordinary prose lines.
+                if s_line.startswith("**"):
+                    status = field_value(s_line, STATUS_PREFIX)
+                    if status:
+                        pending = dataclasses.replace(pending, status=status)
+
+                    raw = field_value(s_line, TAGS_PREFIX)
+                    if raw:
+                        if raw.lower() in {"none", "(none)"}:
+                            tags: tuple[str, ...] = tuple()
+                        else:
+                            tags = tuple(t.strip() for t in raw.split(",") if t.strip())
+                        pending = dataclasses.replace(pending, tags=tags)
+
+                # Lines inside the window never start with "#", so they cannot be headings.
+                continue
+
+        # Headings always start with "#"; skip the regex for everything else.
+        if not line.startswith("#"):
+            continue
+        h = HEADING_RE.match(line)
+        if not h:
+            continue
+
+        level = len(h.group("level"))
+        text = h.group("text")
+
+        # Track H2 as current "section"
+        if level == 2:
+            section = text.strip()
+
+        # Detect anchored ID headings at any level (we recommend H3). Every anchor contains
+        # a literal "<a"/"<A", so plain headings skip the case-insensitive regex.
+        if "<a" not in text and "<A" not in text:
+            continue
+        a = ANCHOR_RE.search(text)
+        if not a:
+            continue
+
+        cid = a.group("id")
+
+        # Duplicate anchors within a file
+        if cid in seen_anchor_lines:
+            ec.add(f"{file_rel}: duplicate ID anchor found for {cid}")
+        else:
+            seen_anchor_lines[cid] = lineno
+
+        # Title is whatever comes after "ID —"; cut around the anchor match instead of re-scanning
+        cleaned = text[: a.start()] + text[a.end():]
+        if "<a" in cleaned or "<A" in cleaned:
+            # More anchors on the same heading: strip them all, as the title never includes them
+            cleaned = ANCHOR_RE.sub("", cleaned)
+        cleaned = cleaned.strip()
+        if cleaned.startswith(cid):
+            cleaned = cleaned[len(cid):].lstrip()
+        if cleaned[:1] in ("—", "-"):
+            cleaned = cleaned[1:].lstrip()
+        title = cleaned or "<Untitled>"
+
+        pending = Entry(
+            id=cid,
+            title=title,
+            status="",
+            tags=tuple(),
+            file=file_rel,
+            rel_link=rel_link,
+            anchor=cid,
+            href=f"{file_rel}#{cid}",
+            section=section,
+        )
+        pending_lookahead = 0
+
+    if pending is not None:
+        finalize(pending)
 
     return entries
 
@@ -260,16 +313,22 @@ def collect_all_entries(ec: ErrorCollector) -> tuple[list[Entry], set[str]]:
             die(f"missing canonical doc: {rel(doc)}")
         entries.extend(parse_entries_from_doc(doc, allowed_tags, ec))
 
-    # Cross-file duplicate IDs
-    dupes: dict[str, list[str]] = {}
+    # Cross-file duplicate IDs (rare: only build a file list once a second occurrence shows up)
+    seen: dict[str, str] = {}
+    collisions: dict[str, list[str]] = {}
     for e in entries:
-        dupes.setdefault(e.id, []).append(e.file)
-    collisions = {k: v for k, v in dupes.items() if len(v) > 1}
-    for cid, files in sorted(collisions.items()):
-        ec.add(f"duplicate ID across files: {cid} appears in {files}")
+        prev = seen.get(e.id)
+        if prev is None:
+            seen[e.id] = e.file
+        elif e.id in collisions:
+            collisions[e.id].append(e.file)
+        else:
+            collisions[e.id] = [prev, e.file]
+    if collisions:
+        for cid, files in sorted(collisions.items()):
+            ec.add(f"duplicate ID across files: {cid} appears in {files}")
 
-    ids = {e.id for e in entries}
-    return entries, ids
+    return entries, set(seen)
 
 
 def collect_adr_entries(ec: ErrorCollector) -> list[ADREntry]:
@@ -288,31 +347,34 @@ def collect_adr_entries(ec: ErrorCollector) -> list[ADREntry]:
         num = int(m.group("num"))
         adr_id = f"ADR-{num:04d}"
 
-        # Parse the ADR file to extract title and status
-        md = read_text(adr_file)
-        lines = md.splitlines()
-
+        # Parse the ADR header to extract title and status
         title = ""
         status = ""
 
-        for line in lines:
-            # Look for H1 title
-            if line.startswith("# ") and not title:
-                title = line[2:].strip()
-                # Remove ADR number prefix if present (e.g., "# ADR-0001: Title" -> "Title")
-                title = re.sub(r"^ADR-\d+[:\s—-]*", "", title, flags=re.IGNORECASE).strip()
-                continue
-
-            # Look for status in frontmatter or body
-            sm = STATUS_RE.match(line.strip())
-            if sm:
-                status = sm.group("status").strip()
-                continue
-
-            # Also check for YAML frontmatter status
-            if line.strip().startswith("status:"):
-                status = line.split(":", 1)[1].strip().strip('"').strip("'")
-                continue
+        with adr_file.open(encoding="utf-8") as f:
+            for lineno, line in enumerate(f):
+                if lineno >= ADR_HEADER_MAX_LINES:
+                    break
+                line = line.rstrip("\n")
+
+                # Look for H1 title
+                if line.startswith("# ") and not title:
+                    title = line[2:].strip()
+                    # Remove ADR number prefix if present (e.g., "# ADR-0001: Title" -> "Title")
+                    title = ADR_TITLE_PREFIX_RE.sub("", title).strip()
+                    continue
+
+                # Look for status in frontmatter or body (a later Status line overrides an earlier one)
+                s_line = line.strip()
+                value = field_value(s_line, STATUS_PREFIX)
+                if value:
+                    status = value
+                    continue
+
+                # Also check for YAML frontmatter status
+                if s_line.startswith("status:"):
+                    status = line.split(":", 1)[1].strip().strip('"').strip("'")
+                    continue
 
         if not title:
             title = m.group("slug").replace("-", " ").title()
@@ -339,24 +401,52 @@ def collect_id_references_in_docs(docs: Iterable[Path]) -> dict[str, set[str]]:
         if not doc.exists():
             # Skip quietly; callers may include optional docs
             continue
-        md = strip_fences(read_text(doc))
-        found = set(ID_RE.findall(md))
+        found = set(ID_RE.findall(read_doc(doc)))
         refs[rel(doc)] = found
     return refs
 
 
-def render_id_index(entries: list[Entry], adr_entries: list[ADREntry] | None = None) -> str:
+def build_indexes(
+    entries: list[Entry],
+) -> tuple[dict[str, list[Entry]], dict[str, list[Entry]], list[dict[str, object]]]:
+    """Group entries by prefix and by tag, and build catalog records, in one sorted pass.
+
+    Entries are sorted once by (prefix, number); grouping preserves that order, so every
+    bucket comes out already sorted.
+    """
     by_prefix: dict[str, list[Entry]] = {}
-    for e in entries:
+    tag_map: dict[str, list[Entry]] = {}
+    payload: list[dict[str, object]] = []
+    for e in sorted(entries, key=lambda x: (x.prefix, x.number)):
         by_prefix.setdefault(e.prefix, []).append(e)
-    for k in by_prefix:
-        by_prefix[k].sort(key=lambda x: x.number)
+        for t in e.tags:
+            tag_map.setdefault(t, []).append(e)
+        payload.append(
+            {
+                "id": e.id,
+                "prefix": e.prefix,
+                "number": e.number,
+                "title": e.title,
+                "status": e.status,
+                "tags": list(e.tags),
+                "file": e.file,
+                "anchor": e.anchor,
+                "href": e.href,
+                "section": e.section,
+            }
+        )
+    return by_prefix, tag_map, payload
+
 
+def render_id_index(
+    by_prefix: dict[str, list[Entry]],
+    adr_entries: list[ADREntry] | None = None,
+) -> str:
     def block(title: str, prefix: str) -> str:
         lines = [f"## {title}", ""]
-        for e in by_prefix.get(prefix, []):
-            rel_link = "./" + Path(e.file).name
-            lines.append(f"- [{e.id}]({rel_link}#{e.id}) — {e.title}")
+        lines.extend(
+            [f"- [{e.id}]({e.rel_link}#{e.id}) — {e.title}" for e in by_prefix.get(prefix, [])]
+        )
         lines.append("")
         return "\n".join(lines)
 
@@ -388,15 +478,7 @@ def render_id_index(entries: list[Entry], adr_entries: list[ADREntry] | None = N
     return "\n".join(out).rstrip() + "\n"
 
 
-def render_id_index_by_tag(entries: list[Entry]) -> str:
-    tag_map: dict[str, list[Entry]] = {}
-    for e in entries:
-        for t in e.tags:
-            tag_map.setdefault(t, []).append(e)
-
-    for t in tag_map:
-        tag_map[t].sort(key=lambda x: (x.prefix, x.number))
-
+def render_id_index_by_tag(tag_map: dict[str, list[Entry]]) -> str:
     out_lines = [
         "# Constitution ID Index by Tag",
         "",
@@ -408,33 +490,18 @@ def render_id_index_by_tag(entries: list[Entry]) -> str:
     ]
 
     for tag in sorted(tag_map.keys()):
-        out_lines.append(f"## {tag}")
-        out_lines.append("")
-        for e in tag_map[tag]:
-            rel_link = "./" + Path(e.file).name
-            out_lines.append(f"- [{e.id}]({rel_link}#{e.id}) — {e.title}")
+        out_lines.extend([f"## {tag}", ""])
+        out_lines.extend([f"- [{e.id}]({e.rel_link}#{e.id}) — {e.title}" for e in tag_map[tag]])
         out_lines.append("")
 
     return "\n".join(out_lines).rstrip() + "\n"
 
 
-def render_catalog(entries: list[Entry], adr_entries: list[ADREntry] | None = None) -> str:
-    payload = []
-    for e in sorted(entries, key=lambda x: (x.prefix, x.number)):
-        payload.append(
-            {
-                "id": e.id,
-                "prefix": e.prefix,
-                "number": e.number,
-                "title": e.title,
-                "status": e.status,
-                "tags": list(e.tags),
-                "file": e.file,
-                "anchor": e.anchor,
-                "href": e.href,
-                "section": e.section,
-            }
-        )
+def render_catalog(
+    entry_records: list[dict[str, object]],
+    adr_entries: list[ADREntry] | None = None,
+) -> str:
+    payload = list(entry_records)
 
     # Add ADR entries
     if adr_entries:
@@ -454,25 +521,44 @@ def render_catalog(entries: list[Entry], adr_entries: list[ADREntry] | None = No
                 }
             )
 
-    return json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+    return CATALOG_ENCODER.encode(payload) + "\n"
+
+
+def same_content(path: Path, data: bytes) -> bool:
+    # Size check first, then compare in chunks so large outputs are never read whole.
+    if not path.exists():
+        return not data
+    if path.stat().st_size != len(data):
+        return False
+    view = memoryview(data)
+    offset = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            if view[offset:offset + len(chunk)] != chunk:
+                return False
+            offset += len(chunk)
+    return offset == len(data)
 
 
 def write_if_changed(path: Path, content: str) -> bool:
-    existing = path.read_text(encoding="utf-8") if path.exists() else ""
-    if existing == content:
+    # Content is rendered with LF line endings; writing bytes keeps them on all platforms.
+    data = content.encode("utf-8")
+    if same_content(path, data):
         return False
     path.parent.mkdir(parents=True, exist_ok=True)
-    # Use newline='\n' to ensure LF line endings on all platforms
-    with open(path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(content)
+    # Write a sibling temp file and swap it in, so an interrupted run never leaves a
+    # truncated generated file behind.
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(data)
+    os.replace(tmp, path)
     return True
 
 
 def check_generated(updates: dict[Path, str], ec: ErrorCollector) -> None:
     changed = []
     for path, expected in updates.items():
-        current = path.read_text(encoding="utf-8") if path.exists() else ""
-        if current != expected:
+        if not same_content(path, expected.encode("utf-8")):
             changed.append(rel(path))
     if changed:
         ec.add(
@@ -511,10 +597,11 @@ def main() -> None:
                 ec.add(f"{file_rel}: references unknown ID {cid}")
 
     # Prepare generated outputs
+    by_prefix, tag_map, entry_records = build_indexes(entries)
     outputs: dict[Path, str] = {
-        CONSTITUTION_DIR / "id-index.md": render_id_index(entries, adr_entries),
-        CONSTITUTION_DIR / "id-index-by-tag.md": render_id_index_by_tag(entries),
-        CONSTITUTION_DIR / "id-catalog.json": render_catalog(entries, adr_entries),
+        CONSTITUTION_DIR / "id-index.md": render_id_index(by_prefix, adr_entries),
+        CONSTITUTION_DIR / "id-index-by-tag.md": render_id_index_by_tag(tag_map),
+        CONSTITUTION_DIR / "id-catalog.json": render_catalog(entry_records, adr_entries),
     }
 
     if args.cmd == "generate":
@@ -20,12 +20,13 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import functools
 import glob
 import json
 import re
 import sys
 from pathlib import Path
-from typing import NamedTuple
+from typing import AbstractSet, NamedTuple
 
 ROOT = Path(__file__).resolve().parents[1]
 SPECS_DIR = ROOT / "docs" / "specs"
@@ -34,15 +35,16 @@ CATALOG_PATH = ROOT / "docs" / "constitution" / "id-catalog.json"
 # Trace block pattern: ```trace ... ```
 TRACE_BLOCK_RE = re.compile(r"```trace\s*\n(.+?)\n```", re.DOTALL)
 
-# Field patterns within trace block
-ISSUE_RE = re.compile(r"^Issue:\s*(?:#?(\d+)|N/A)\s*$", re.MULTILINE)
-SPEC_RE = re.compile(r"^Spec:\s*(.+?)\s*$", re.MULTILINE)
-CONSTITUTION_RE = re.compile(r"^Constitution:\s*(.+?)\s*$", re.MULTILINE)
-ADRS_RE = re.compile(r"^ADRs:\s*(.+?)\s*$", re.MULTILINE)
+# Field lines within trace block ("Key: value"); values never span lines
+FIELD_RE = re.compile(r"^(Issue|Spec|Constitution|ADRs):[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+ISSUE_VALUE_RE = re.compile(r"#?(\d+)|N/A")
 
 # ID pattern
 ID_RE = re.compile(r"\b(?:INV|DM|AC|KC|ADR)-\d{4}\b")
 
+# Spec filename pattern: FS-NNNN-slug.md
+SPEC_FILENAME_RE = re.compile(r"^FS-(\d+)-.*\.md$")
+
 # Spec frontmatter issue pattern
 SPEC_ISSUE_RE = re.compile(r"^issue:\s*#?(\d+)\s*$", re.MULTILINE | re.IGNORECASE)
 
@@ -63,17 +65,23 @@ class ValidationResult(NamedTuple):
     warnings: list[str]
 
 
-def load_catalog() -> set[str]:
-    """Load known IDs from the constitution catalog."""
+@functools.lru_cache(maxsize=1)
+def load_catalog() -> frozenset[str]:
+    """Load known IDs from the constitution catalog (parsed once per process)."""
     if not CATALOG_PATH.exists():
-        return set()
+        return frozenset()
 
     try:
-        with open(CATALOG_PATH, encoding="utf-8") as f:
-            catalog = json.load(f)
-        return {entry["id"] for entry in catalog}
+        catalog = json.loads(CATALOG_PATH.read_bytes())
+        return frozenset(entry["id"] for entry in catalog)
     except (json.JSONDecodeError, KeyError):
-        return set()
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=512)
+def rel(path: Path) -> str:
+    """Repo-relative POSIX path for messages."""
+    return path.relative_to(ROOT).as_posix()
 
 
 def parse_trace_block(pr_body: str) -> TraceBlock | None:
@@ -84,51 +92,54 @@ def parse_trace_block(pr_body: str) -> TraceBlock | None:
 
     raw = match.group(1)
 
-    # Extract issue
-    issue_match = ISSUE_RE.search(raw)
-    if issue_match:
-        issue = issue_match.group(1) if issue_match.group(1) else "N/A"
-    else:
-        issue = None
+    # Collect all fields in one pass (first occurrence wins; for Issue, the first valid one)
+    fields: dict[str, str] = {}
+    issue: str | None = None
+    for m in FIELD_RE.finditer(raw):
+        key, value = m.groups()
+        if not value:
+            continue
+        if key == "Issue":
+            if issue is None:
+                issue_match = ISSUE_VALUE_RE.fullmatch(value)
+                if issue_match:
+                    issue = issue_match.group(1) if issue_match.group(1) else "N/A"
+        else:
+            fields.setdefault(key, value)
 
     # Extract spec
-    spec_match = SPEC_RE.search(raw)
-    spec = spec_match.group(1).strip() if spec_match else None
+    spec = fields.get("Spec")
 
     # Extract constitution IDs
-    constitution: list[str] = []
-    const_match = CONSTITUTION_RE.search(raw)
-    if const_match:
-        const_value = const_match.group(1).strip()
-        if const_value:
-            constitution = [id_.strip() for id_ in ID_RE.findall(const_value)]
+    constitution: list[str] = ID_RE.findall(fields.get("Constitution", ""))
 
     # Extract ADR IDs
     adrs: list[str] = []
-    adrs_match = ADRS_RE.search(raw)
-    if adrs_match:
-        adrs_value = adrs_match.group(1).strip()
-        if adrs_value.lower() != "none" and adrs_value:
-            adrs = [id_.strip() for id_ in ID_RE.findall(adrs_value)]
+    adrs_value = fields.get("ADRs", "")
+    if adrs_value.lower() != "none":
+        adrs = ID_RE.findall(adrs_value)
 
     return TraceBlock(issue=issue, spec=spec, constitution=constitution, adrs=adrs, raw=raw)
 
 
+@functools.lru_cache(maxsize=1)
+def spec_index() -> dict[str, Path]:
+    """Map the issue number in each spec filename (as written, e.g. "0007") to its path."""
+    index: dict[str, Path] = {}
+    if not SPECS_DIR.is_dir():
+        return index
+    for path in sorted(SPECS_DIR.iterdir()):
+        match = SPEC_FILENAME_RE.match(path.name)
+        if match:
+            index.setdefault(match.group(1), path)
+    return index
+
+
 def find_spec_for_issue(issue_num: str) -> Path | None:
     """Find a spec file for the given issue number."""
     # Try exact match first: FS-NNNN-*.md
-    padded = issue_num.zfill(4)
-    patterns = [
-        f"FS-{padded}-*.md",
-        f"FS-{issue_num}-*.md",
-    ]
-
-    for pattern in patterns:
-        matches = list(SPECS_DIR.glob(pattern))
-        if matches:
-            return matches[0]
-
-    return None
+    index = spec_index()
+    return index.get(issue_num.zfill(4)) or index.get(issue_num)
 
 
 def get_spec_issue(spec_path: Path) -> str | None:
@@ -144,7 +155,7 @@ def get_spec_issue(spec_path: Path) -> str | None:
     return None
 
 
-def validate_trace_block(pr_body: str, catalog_ids: set[str]) -> ValidationResult:
+def validate_trace_block(pr_body: str, catalog_ids: AbstractSet[str]) -> ValidationResult:
     """Validate the trace block in PR body."""
     errors: list[str] = []
     warnings: list[str] = []
@@ -171,7 +182,7 @@ def validate_trace_block(pr_body: str, catalog_ids: set[str]) -> ValidationResul
             if existing_spec:
                 warnings.append(
                     f"Spec marked as '{trace.spec}' but spec exists for issue #{trace.issue}: "
-                    f"{existing_spec.relative_to(ROOT).as_posix()}"
+                    f"{rel(existing_spec)}"
                 )
         else:
             # Non-trivial - validate spec exists and links match
@@ -192,7 +203,7 @@ def validate_trace_block(pr_body: str, catalog_ids: set[str]) -> ValidationResul
             # Check if there's a spec for this issue that wasn't referenced
             expected_spec = find_spec_for_issue(trace.issue)
             if expected_spec:
-                expected_path = expected_spec.relative_to(ROOT).as_posix()
+                expected_path = rel(expected_spec)
                 declared_path = trace.spec.replace("\\", "/")
                 if expected_path != declared_path:
                     warnings.append(
@@ -206,7 +217,7 @@ def validate_trace_block(pr_body: str, catalog_ids: set[str]) -> ValidationResul
         if existing_spec and not (trace.spec and NO_SPEC_PATTERN.match(trace.spec)):
             errors.append(
                 f"Spec exists for issue #{trace.issue} at "
-                f"{existing_spec.relative_to(ROOT).as_posix()}, but Spec field is missing"
+                f"{rel(existing_spec)}, but Spec field is missing"
             )
 
     # Validate Constitution IDs
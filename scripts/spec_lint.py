@@ -17,17 +17,27 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
+import os
 import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import NamedTuple
+from typing import AbstractSet, NamedTuple
 
 ROOT = Path(__file__).resolve().parents[1]
+ROOT_PREFIX = str(ROOT) + os.sep
 SPECS_DIR = ROOT / "docs" / "specs"
 CATALOG_PATH = ROOT / "docs" / "constitution" / "id-catalog.json"
 
+# Lint specs in worker processes once there are enough of them to amortize process
+# startup; below this, serial linting is faster.
+PARALLEL_LINT_MIN_SPECS = 32
+# How many upcoming specs a serial run asks the kernel to read ahead
+PREFETCH_AHEAD = min(16, os.cpu_count() or 1)
+
 # Required sections (must exist and have content)
 REQUIRED_SECTIONS = [
     "Problem",
@@ -46,191 +56,390 @@ OPTIONAL_SECTIONS = [
     "Alternatives",
 ]
 
+# Sections the linter knows about; other H2s only delimit these
+KNOWN_SECTIONS = frozenset(REQUIRED_SECTIONS + OPTIONAL_SECTIONS)
+
 # Frontmatter fields
-REQUIRED_FRONTMATTER = ["status", "issue", "title"]
+REQUIRED_FRONTMATTER = ("status", "issue", "title")
 
 # Valid status values
 VALID_STATUSES = {"Draft", "Approved", "Implemented"}
 
-# ID patterns
-ID_RE = re.compile(r"\b(?:INV|DM|AC|KC|ADR)-\d{4}\b")
-NEW_CONCEPT_RE = re.compile(r"\bNEW:\s*(\w+)")
+# Frontmatter "key: value" line, split at the first colon with surrounding whitespace trimmed
+FRONTMATTER_KV_RE = re.compile(r"^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+# First non-whitespace character (used to test section spans for emptiness)
+NON_SPACE_RE = re.compile(r"\S")
+
+# Single-pass scanner for the IDs, H2 headings and NEW: concepts in a spec body. IDs are
+# consumed; the other alternatives are zero-width lookaheads, so a heading line that also
+# contains an ID or NEW: concept is still reported by every check.
+SCAN_RE = re.compile(
+    # Constitution / ADR ID references
+    r"(?P<id>\b(?:INV|DM|AC|KC|ADR)-\d{4}\b)"
+    # H2 section heading
+    r"|^(?=##\s+(?P<section>.+?)\s*$)"
+    # Unresolved domain concept
+    r"|(?=\bNEW:\s*(?P<new>\w+))",
+    re.MULTILINE,
+)
+
+# Tier 0 subsection heading (must have at least one bullet), matched at a "###"
+TIER0_HEADING_RE = re.compile(r"###\s+(?i:Tier)\s+0[^\n]*\n")
+
+# Checklist bullet: "- [ ]" / "* [x]"
+BULLET_RE = re.compile(r"^\s*[-*]\s+\[.\]", re.MULTILINE)
 
-# Section heading pattern
-SECTION_RE = re.compile(r"^##\s+(.+?)\s*$", re.MULTILINE)
 
-# Frontmatter pattern
-FRONTMATTER_RE = re.compile(r"^---\s*\n(.+?)\n---", re.DOTALL)
+class Finding(NamedTuple):
+    path: str  # spec path relative to ROOT ("" for messages without a path prefix)
+    code: str  # key into FINDING_FORMATS
+    args: tuple[str, ...] = ()
 
-# Tier 0 section pattern (must have at least one bullet)
-TIER0_RE = re.compile(r"###\s+Tier\s+0[^\n]*\n(.*?)(?=###|\Z)", re.DOTALL | re.IGNORECASE)
-BULLET_RE = re.compile(r"^\s*[-*]\s+\[.\]", re.MULTILINE)
+
+# Message templates for Finding codes; formatted only when reporting
+FINDING_FORMATS = {
+    "unreadable": "Cannot read file: {0}",
+    "no_frontmatter": "Missing YAML frontmatter",
+    "missing_field": "Missing frontmatter field: {0}",
+    "invalid_status": "Invalid status '{0}' (must be one of: {1})",
+    "missing_section": "Missing required section: ## {0}",
+    "empty_section": "Section '## {0}' is empty",
+    "tier0_no_bullet": "Tier 0 gate plan must have at least one bullet item",
+    "no_tier0": "Gate Plan must include '### Tier 0' subsection",
+    "unknown_id": "References unknown ID: {0}",
+    "unresolved_concept": (
+        "Status is '{0}' but contains unresolved 'NEW: {1}' (must resolve to DM-* before approval)"
+    ),
+    "draft_concept": "Draft spec contains 'NEW: {0}' (resolve before approval)",
+}
+
+
+def format_finding(finding: Finding) -> str:
+    message = FINDING_FORMATS[finding.code].format(*finding.args)
+    return f"{finding.path}: {message}" if finding.path else message
 
 
 class LintResult(NamedTuple):
-    errors: list[str]
-    warnings: list[str]
+    errors: list[Finding]
+    warnings: list[Finding]
+
+
+class SpecScan(NamedTuple):
+    headings: list[tuple[str, int, int]]  # (name, heading start, body start) per H2
+    ids: set[str]
+    new_concepts: list[str]
+
+
+def scan_spec(content: str) -> SpecScan:
+    """Collect headings, IDs and NEW: concepts in one pass."""
+    headings: list[tuple[str, int, int]] = []
+    ids: set[str] = set()
+    new_concepts: list[str] = []
+
+    for m in SCAN_RE.finditer(content):
+        kind = m.lastgroup
+        if kind == "id":
+            ids.add(m.group("id"))
+        elif kind == "section":
+            headings.append((m.group("section").strip(), m.start(), m.end("section")))
+        elif kind == "new":
+            new_concepts.append(m.group("new"))
+
+    return SpecScan(headings, ids, new_concepts)
+
 
+def find_tier0(content: str) -> tuple[int, int] | None:
+    """Return the body span of the first "### Tier 0" subsection, or None."""
+    pos = content.find("###")
+    while pos >= 0:
+        m = TIER0_HEADING_RE.match(content, pos)
+        if m:
+            # The subsection runs until the next "###" (of any heading depth) or end of file
+            start = m.end()
+            end = content.find("###", start)
+            return (start, end if end >= 0 else len(content))
+        pos = content.find("###", pos + 1)
+    return None
 
-def load_catalog() -> set[str]:
+
+def load_catalog() -> frozenset[str]:
     """Load known IDs from the constitution catalog."""
-    if not CATALOG_PATH.exists():
-        return set()
+    try:
+        mtime_ns = CATALOG_PATH.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return load_catalog_version(mtime_ns)
 
+
+@functools.lru_cache(maxsize=1)
+def load_catalog_version(mtime_ns: int) -> frozenset[str]:
+    # Keyed on the catalog's mtime so repeated loads are free until the file changes
     try:
-        with open(CATALOG_PATH, encoding="utf-8") as f:
-            catalog = json.load(f)
-        return {entry["id"] for entry in catalog}
-    except (json.JSONDecodeError, KeyError):
-        return set()
+        catalog = json.loads(CATALOG_PATH.read_bytes())
+        return frozenset(entry["id"] for entry in catalog)
+    except (OSError, json.JSONDecodeError, KeyError):
+        return frozenset()
 
 
 def parse_frontmatter(content: str) -> dict[str, str]:
     """Extract YAML frontmatter from spec content."""
-    match = FRONTMATTER_RE.match(content)
-    if not match:
+    # Opening "---" must be alone on the first line (trailing whitespace allowed)
+    if not content.startswith("---"):
+        return {}
+    start = content.find("\n", 3)
+    if start < 0 or content[3:start].strip():
         return {}
 
-    frontmatter = {}
-    for line in match.group(1).splitlines():
-        if ":" in line:
-            key, value = line.split(":", 1)
-            frontmatter[key.strip().lower()] = value.strip().strip('"').strip("'")
-    return frontmatter
+    # Closing "---" starts a later line; the block must not be empty
+    end = content.find("\n---", start + 2)
+    if end < 0:
+        return {}
+
+    return {
+        key.lower(): value.strip('"').strip("'")
+        for key, value in FRONTMATTER_KV_RE.findall(content, start + 1, end)
+    }
+
 
+def find_sections(content: str, headings: list[tuple[str, int, int]]) -> dict[str, tuple[int, int]]:
+    """Map each known H2 section (from scan_spec headings) to the (start, end) span of its content.
 
-def find_sections(content: str) -> dict[str, str]:
-    """Find all H2 sections and their content."""
-    sections: dict[str, str] = {}
-    matches = list(SECTION_RE.finditer(content))
+    Every H2 ends the previous section, but only REQUIRED_SECTIONS/OPTIONAL_SECTIONS are kept.
+    """
+    sections: dict[str, tuple[int, int]] = {}
 
-    for i, match in enumerate(matches):
-        section_name = match.group(1).strip()
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-        section_content = content[start:end].strip()
-        sections[section_name] = section_content
+    for i, (section_name, _, start) in enumerate(headings):
+        if section_name not in KNOWN_SECTIONS:
+            continue
+        end = headings[i + 1][1] if i + 1 < len(headings) else len(content)
+        sections[section_name] = (start, end)
 
     return sections
 
 
-def lint_spec(path: Path, catalog_ids: set[str]) -> LintResult:
+def is_blank(content: str, start: int, end: int) -> bool:
+    """True if content[start:end] is whitespace only (stops at the first non-space char)."""
+    return NON_SPACE_RE.search(content, start, end) is None
+
+
+def read_spec(path: Path) -> str:
+    """Read a spec as UTF-8 text with LF line endings.
+
+    Decodes the raw bytes in one call rather than through a text-mode stream, and only
+    pays for newline translation when the file actually contains a CR.
+    """
+    content = path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def spec_rel_path(path: Path) -> str:
+    """Return path relative to ROOT for messages, falling back to str(path) outside ROOT."""
+    path_str = str(path)
+    # Paths built from ROOT (the common case) need no resolve() syscalls
+    if path_str.startswith(ROOT_PREFIX) and ".." not in path.parts:
+        return path_str[len(ROOT_PREFIX) :].replace(os.sep, "/")
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path_str
+
+
+def lint_spec(path: Path, catalog_ids: AbstractSet[str]) -> LintResult:
     """Lint a single spec file."""
-    errors: list[str] = []
-    warnings: list[str] = []
+    errors: list[Finding] = []
+    warnings: list[Finding] = []
+    add_error = errors.append
+    add_warning = warnings.append
 
     try:
-        content = path.read_text(encoding="utf-8")
+        content = read_spec(path)
     except Exception as e:
-        return LintResult([f"Cannot read file: {e}"], [])
+        return LintResult([Finding("", "unreadable", (str(e),))], [])
 
     # Get relative path for error messages (handle both absolute and relative paths)
-    try:
-        rel_path = path.resolve().relative_to(ROOT).as_posix()
-    except ValueError:
-        rel_path = str(path)
+    rel_path = spec_rel_path(path)
 
     # Check frontmatter
     frontmatter = parse_frontmatter(content)
+    status = frontmatter.get("status", "")
     if not frontmatter:
-        errors.append(f"{rel_path}: Missing YAML frontmatter")
+        add_error(Finding(rel_path, "no_frontmatter"))
     else:
         for field in REQUIRED_FRONTMATTER:
             if field not in frontmatter or not frontmatter[field]:
-                errors.append(f"{rel_path}: Missing frontmatter field: {field}")
+                add_error(Finding(rel_path, "missing_field", (field,)))
 
         # Validate status
-        status = frontmatter.get("status", "")
         if status and status not in VALID_STATUSES:
-            errors.append(
-                f"{rel_path}: Invalid status '{status}' (must be one of: {', '.join(VALID_STATUSES)})"
-            )
+            add_error(Finding(rel_path, "invalid_status", (status, ", ".join(VALID_STATUSES))))
+
+    # Scan the body once; the checks below only consult the collected matches
+    scan = scan_spec(content)
 
     # Find sections
-    sections = find_sections(content)
+    sections = find_sections(content, scan.headings)
 
     # Check required sections
     for section in REQUIRED_SECTIONS:
         if section not in sections:
-            errors.append(f"{rel_path}: Missing required section: ## {section}")
-        elif not sections[section].strip():
-            errors.append(f"{rel_path}: Section '## {section}' is empty")
+            add_error(Finding(rel_path, "missing_section", (section,)))
+        elif is_blank(content, *sections[section]):
+            add_error(Finding(rel_path, "empty_section", (section,)))
 
     # Check Tier 0 gate plan has at least one bullet
-    tier0_match = TIER0_RE.search(content)
-    if tier0_match:
-        tier0_content = tier0_match.group(1)
-        if not BULLET_RE.search(tier0_content):
-            errors.append(f"{rel_path}: Tier 0 gate plan must have at least one bullet item")
+    tier0 = find_tier0(content)
+    if tier0:
+        if not BULLET_RE.search(content, *tier0):
+            add_error(Finding(rel_path, "tier0_no_bullet"))
     elif "Gate Plan" in sections:
         # Gate Plan exists but no Tier 0 subsection
-        errors.append(f"{rel_path}: Gate Plan must include '### Tier 0' subsection")
+        add_error(Finding(rel_path, "no_tier0"))
 
     # Validate referenced IDs exist in catalog
     if catalog_ids:
-        referenced_ids = set(ID_RE.findall(content))
-        for ref_id in sorted(referenced_ids):
-            if ref_id not in catalog_ids:
-                errors.append(f"{rel_path}: References unknown ID: {ref_id}")
+        for ref_id in sorted(scan.ids - catalog_ids):
+            add_error(Finding(rel_path, "unknown_id", (ref_id,)))
 
     # Check NEW: concepts based on status
-    status = frontmatter.get("status", "Draft")
-    new_concepts = NEW_CONCEPT_RE.findall(content)
+    new_concepts = scan.new_concepts
     if new_concepts:
         if status in {"Approved", "Implemented"}:
             for concept in new_concepts:
-                errors.append(
-                    f"{rel_path}: Status is '{status}' but contains unresolved 'NEW: {concept}' "
-                    f"(must resolve to DM-* before approval)"
-                )
+                add_error(Finding(rel_path, "unresolved_concept", (status, concept)))
         else:
             for concept in new_concepts:
-                warnings.append(f"{rel_path}: Draft spec contains 'NEW: {concept}' (resolve before approval)")
+                add_warning(Finding(rel_path, "draft_concept", (concept,)))
 
     return LintResult(errors, warnings)
 
 
+# Catalog IDs for pool workers, installed once per process by init_worker()
+_worker_catalog_ids: AbstractSet[str] = frozenset()
+
+
+def init_worker(catalog_ids: AbstractSet[str]) -> None:
+    global _worker_catalog_ids
+    _worker_catalog_ids = catalog_ids
+
+
+def lint_one(path: Path) -> LintResult:
+    """Lint a spec in a pool worker, against the catalog installed by init_worker()."""
+    return lint_spec(path, _worker_catalog_ids)
+
+
+def prefetch(path: Path) -> None:
+    """Hint the kernel to start reading path into the page cache (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def lint_serial(specs: list[Path], catalog_ids: AbstractSet[str]) -> list[LintResult]:
+    """Lint specs in order, prefetching the next few while the current one is checked."""
+    if not hasattr(os, "posix_fadvise"):
+        return [lint_spec(spec, catalog_ids) for spec in specs]
+    for spec in specs[:PREFETCH_AHEAD]:
+        prefetch(spec)
+    results = []
+    for i, spec in enumerate(specs):
+        if i + PREFETCH_AHEAD < len(specs):
+            prefetch(specs[i + PREFETCH_AHEAD])
+        results.append(lint_spec(spec, catalog_ids))
+    return results
+
+
+def lint_all(
+    specs: list[Path],
+    catalog_ids: AbstractSet[str],
+    jobs: int | None = None,
+) -> list[LintResult]:
+    """Lint specs, returning results in input order.
+
+    jobs=None uses a process pool only when there are many specs; jobs=1 forces a serial run
+    and jobs>1 sets the pool size.
+    """
+    if jobs == 1 or len(specs) < 2 or (jobs is None and len(specs) < PARALLEL_LINT_MIN_SPECS):
+        return lint_serial(specs, catalog_ids)
+
+    # Imported here: concurrent.futures pulls in multiprocessing, which costs more than
+    # linting a handful of specs
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs or os.cpu_count() or 1, len(specs)),
+        initializer=init_worker,
+        initargs=(catalog_ids,),
+    ) as ex:
+        return list(ex.map(lint_one, specs, chunksize=8))
+
+
 def get_changed_specs() -> list[Path]:
     """Get list of specs changed in current git diff."""
     try:
+        # Working tree vs HEAD covers both staged and unstaged changes in one git call
         result = subprocess.run(
-            ["git", "diff", "--name-only", "HEAD"],
+            ["git", "diff", "--name-only", "-z", "HEAD"],
             capture_output=True,
-            text=True,
             cwd=ROOT,
             check=True,
         )
-        changed = result.stdout.strip().splitlines()
-
-        # Also check staged files
-        result_staged = subprocess.run(
-            ["git", "diff", "--name-only", "--cached"],
-            capture_output=True,
-            text=True,
-            cwd=ROOT,
-            check=True,
-        )
-        changed.extend(result_staged.stdout.strip().splitlines())
-
-        specs = []
-        for file in set(changed):
-            if file.startswith("docs/specs/") and file.endswith(".md"):
-                path = ROOT / file
-                if path.exists() and path.name != "_TEMPLATE.md":
-                    specs.append(path)
-        return specs
     except subprocess.CalledProcessError:
         return []
 
+    names = result.stdout.decode("utf-8").split("\0")
+    candidates = (
+        f for f in names
+        if f.startswith("docs/specs/") and f.endswith(".md") and f != "docs/specs/_TEMPLATE.md"
+    )
+
+    # One directory listing instead of an exists() call per changed path
+    present: set[str] = set()
+    if SPECS_DIR.is_dir():
+        with os.scandir(SPECS_DIR) as it:
+            present = {e.name for e in it if e.is_file()}
+
+    specs = []
+    for file in candidates:
+        path = ROOT / file
+        exists = path.name in present if path.parent == SPECS_DIR else path.is_file()
+        if exists:
+            specs.append(path)
+    return specs
+
 
 def get_all_specs() -> list[Path]:
-    """Get all spec files."""
-    if not SPECS_DIR.exists():
+    """Get all spec files, sorted by name."""
+    try:
+        with os.scandir(SPECS_DIR) as it:
+            names = [
+                e.name for e in it
+                if e.name.endswith(".md")
+                and e.name not in ("_TEMPLATE.md", "README.md")
+                and e.is_file()
+            ]
+    except FileNotFoundError:
         return []
-    return [
-        p for p in SPECS_DIR.glob("*.md")
-        if p.name != "_TEMPLATE.md" and p.name != "README.md"
-    ]
+    names.sort()
+    return [SPECS_DIR / name for name in names]
+
+
+def report_findings(header: str, findings: list[Finding]) -> None:
+    """Format findings under a header and write them to stderr in one call."""
+    buf = io.StringIO()
+    buf.write(header + "\n")
+    for finding in findings:
+        buf.write(f"  - {format_finding(finding)}\n")
+    sys.stderr.write(buf.getvalue())
 
 
 def main() -> None:
@@ -238,13 +447,25 @@ def main() -> None:
     parser.add_argument("files", nargs="*", help="Specific files to lint")
     parser.add_argument("--changed", action="store_true", help="Only lint changed files")
     parser.add_argument("--warnings-as-errors", action="store_true", help="Treat warnings as errors")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        metavar="N",
+        help=(
+            "Lint with N worker processes "
+            f"(1 = serial; default: parallel for {PARALLEL_LINT_MIN_SPECS}+ specs)"
+        ),
+    )
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Determine which files to lint
     if args.files:
-        specs = [Path(f) for f in args.files]
+        specs = sorted(Path(f) for f in args.files)
     elif args.changed:
-        specs = get_changed_specs()
+        specs = sorted(get_changed_specs())
         if not specs:
             print("No changed specs found.")
             sys.exit(0)
@@ -261,25 +482,22 @@ def main() -> None:
         print("WARNING: Could not load ID catalog; skipping ID validation", file=sys.stderr)
 
     # Lint each spec
-    all_errors: list[str] = []
-    all_warnings: list[str] = []
+    all_errors: list[Finding] = []
+    all_warnings: list[Finding] = []
+
+    results = lint_all(specs, catalog_ids, args.jobs)
 
-    for spec in sorted(specs):
-        result = lint_spec(spec, catalog_ids)
+    for result in results:
         all_errors.extend(result.errors)
         all_warnings.extend(result.warnings)
 
     # Report results
     if all_warnings:
-        print("WARNINGS:", file=sys.stderr)
-        for w in all_warnings:
-            print(f"  - {w}", file=sys.stderr)
+        report_findings("WARNINGS:", all_warnings)
         print()
 
     if all_errors:
-        print("ERRORS:", file=sys.stderr)
-        for e in all_errors:
-            print(f"  - {e}", file=sys.stderr)
+        report_findings("ERRORS:", all_errors)
         print()
         print(f"Spec lint failed: {len(all_errors)} error(s), {len(all_warnings)} warning(s)")
         sys.exit(1)